@@ -0,0 +1,64 @@
+"""
+Benchmark: checkpoint cost per phase.
+
+Replays every tick of a WORK, SHORT and LONG phase against `Checkpoint.maybe_save`
+(with a simulated clock, one second per tick) plus the forced save at the phase
+change, and reports how many writes happened and the total time spent.
+
+Usage:
+    python benchmarks/bench_checkpoint.py
+    python benchmarks/bench_checkpoint.py --interval 5
+"""
+
+from pathlib import Path
+import argparse
+import datetime as dt
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from checkpoint import Checkpoint  # noqa: E402
+from storage import DEFAULT_CFG  # noqa: E402
+from timer import PomodoroTimer  # noqa: E402
+
+
+def run_phase(ckpt: Checkpoint, timer: PomodoroTimer, clock: list) -> tuple[int, float]:
+    phase_start = dt.datetime.now()
+    writes = 0
+    t0 = time.perf_counter()
+    for remaining in range(timer.planned_seconds(), -1, -1):
+        timer.remaining = remaining
+        writes += ckpt.maybe_save(timer, phase_start, "Python")
+        clock[0] += 1.0
+    timer._advance_phase()
+    ckpt.save(timer, dt.datetime.now(), "Python")
+    writes += 1
+    return writes, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=10.0, help="checkpoint min_interval (s)")
+    args = parser.parse_args()
+
+    clock = [0.0]
+    timer = PomodoroTimer(None, None, dict(DEFAULT_CFG))
+    timer.running = True
+    with tempfile.TemporaryDirectory() as tmp:
+        ckpt = Checkpoint(Path(tmp), min_interval=args.interval, clock=lambda: clock[0])
+        print(f"{'phase':<6} {'ticks':>6} {'writes':>7} {'total µs':>10} {'µs/tick':>8}")
+        seen = set()
+        while len(seen) < 3:
+            state = timer.state
+            ticks = timer.planned_seconds() + 1
+            writes, elapsed = run_phase(ckpt, timer, clock)
+            if state not in seen:
+                seen.add(state)
+                print(f"{state:<6} {ticks:>6} {writes:>7} {elapsed * 1e6:>10.1f} {elapsed * 1e6 / ticks:>8.2f}")
+        ckpt.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: load time and resident memory of sessions.csv vs Parquet vs Arrow IPC.
+
+Each format is loaded through `reports.load_sessions_df` in a fresh subprocess.
+Memory is the growth of RSS across the load itself (DataFrame still alive), so the
+cost of importing pandas, pyarrow, matplotlib and tkinter is excluded. Mapped Arrow
+pages count once they are touched.
+
+Usage:
+    python benchmarks/bench_formats.py                 # synthetic log, 1,000,000 sessions
+    python benchmarks/bench_formats.py --rows 200000
+    python benchmarks/bench_formats.py --csv data/sessions.csv
+"""
+
+from pathlib import Path
+import argparse
+import csv
+import datetime as dt
+import json
+import subprocess
+import sys
+import tempfile
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+import interop  # noqa: E402
+from paths import sessions_csv  # noqa: E402
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+from pathlib import Path
+import interop, reports
+interop._pyarrow()  # import pyarrow up front for every format
+
+
+def rss_mb():
+    try:  # current resident set (Linux)
+        import os
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:  # peak resident set (macOS/BSD)
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+base = rss_mb()
+t0 = time.perf_counter()
+df = reports.load_sessions_df(Path({path!r}))
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"rows": len(df), "seconds": elapsed, "rss_mb": rss_mb() - base}}))
+"""
+
+
+def write_synthetic_csv(path: Path, rows: int) -> None:
+    phases = ["WORK", "SHORT", "WORK", "SHORT", "WORK", "SHORT", "WORK", "LONG"]
+    tags = ["Python", "Reading", "Email", "Design", ""]
+    t = dt.datetime(2015, 1, 1, 8, 0, 0)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["start", "end", "phase", "duration_sec", "tag"])
+        for i in range(rows):
+            phase = phases[i % len(phases)]
+            duration = 1500 if phase == "WORK" else 300 if phase == "SHORT" else 900
+            end = t + dt.timedelta(seconds=duration)
+            w.writerow([t.isoformat(timespec="seconds"), end.isoformat(timespec="seconds"),
+                        phase, duration, tags[i % len(tags)]])
+            t = end + dt.timedelta(seconds=60)
+
+
+def measure(path: Path) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(src=str(SRC), path=str(path))],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", type=Path, help="existing sessions.csv (default: synthetic)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="synthetic row count")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = args.csv or sessions_csv(tmp)
+        if args.csv is None:
+            write_synthetic_csv(csv_path, args.rows)
+
+        files = {"csv": csv_path}
+        for fmt, suffix in (("parquet", ".parquet"), ("arrow", ".arrow")):
+            files[fmt] = tmp / f"sessions{suffix}"
+            interop.export_sessions(csv_path, files[fmt])
+
+        base = None
+        print(f"{'format':<8} {'rows':>10} {'size MB':>9} {'load s':>8} {'load RSS MB':>12} {'speedup':>8}")
+        for fmt, path in files.items():
+            r = measure(path)
+            base = base or r["seconds"]
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(f"{fmt:<8} {r['rows']:>10} {size_mb:>9.1f} {r['seconds']:>8.3f} "
+                  f"{r['rss_mb']:>12.1f} {base / r['seconds']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
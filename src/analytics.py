@@ -0,0 +1,323 @@
+"""
+Incremental Focus Analytics
+---------------------------
+Streaks, daily-goal progress and rolling averages of WORK minutes, maintained
+incrementally as sessions are appended so that reading them never rescans history.
+
+Design notes
+- State lives in `<data_dir>/analytics.json` and is bounded in size: only the last
+  `WINDOW_DAYS` days of WORK minutes are kept, plus the streak counters.
+- `record_work_session` is called by `storage.append_session` for every WORK phase.
+  Sessions are attributed to the date of their start (same as `reports.daily_work_minutes`).
+- Out-of-order sessions (e.g. merged by sync.py) are folded into the window; only
+  sessions older than the window, or joining a streak that leaves it, force a rebuild.
+- The state stores a fingerprint of the sessions.csv it was built from (size plus
+  digests of its first and last 4 KB). If the file is missing, replaced or edited,
+  the state is rebuilt once from sessions.csv; appends only extend the fingerprint.
+- Rolling averages are over calendar days (days without focus count as zero).
+"""
+
+from pathlib import Path
+import csv
+import datetime as dt
+import hashlib
+import json
+
+from paths import sessions_csv
+
+STATS_FILE = "analytics.json"
+WINDOW_DAYS = 28
+DEFAULT_DAILY_GOAL_MIN = 100
+EDGE_BYTES = 4096
+
+# Data folders whose rebuild failed in this process (see rebuild_stats)
+_REBUILD_FAILED: set = set()
+
+
+def _empty_stats() -> dict:
+    return {
+        "days": {},            # ISO date -> WORK minutes (last WINDOW_DAYS days only)
+        "last_date": None,     # most recent ISO date with a WORK session
+        "current_streak": 0,   # consecutive focus days ending at last_date
+        "longest_streak": 0,
+    }
+
+
+def _rescan_window_streaks(stats: dict, day: dt.date) -> bool:
+    """
+    Recompute streaks from the in-memory window after an out-of-order focus day.
+
+    Returns:
+        False if the run through `day` reaches the window's oldest day, since its
+        true length then depends on history outside the window.
+    """
+    newest = dt.date.fromisoformat(stats["last_date"])
+    present = [
+        (newest - dt.timedelta(days=i)).isoformat() in stats["days"]
+        for i in range(WINDOW_DAYS - 1, -1, -1)
+    ]  # oldest .. newest
+    pos = WINDOW_DAYS - 1 - (newest - day).days
+    if all(present[:pos + 1]):
+        return False
+    run = longest = 0
+    for p in present:
+        run = run + 1 if p else 0
+        longest = max(longest, run)
+    if not all(present):
+        stats["current_streak"] = run
+    stats["longest_streak"] = max(stats["longest_streak"], longest)
+    return True
+
+
+def _apply_session(stats: dict, start_dt: dt.datetime, duration_sec: int) -> bool:
+    """
+    Fold one WORK session into `stats` in place (O(1) in history length).
+
+    Returns:
+        False if the session is too old for the window to account for it,
+        in which case the caller must rebuild from sessions.csv.
+    """
+    day = start_dt.date()
+    key = day.isoformat()
+    days = stats["days"]
+    last = dt.date.fromisoformat(stats["last_date"]) if stats["last_date"] else None
+
+    if last is not None and day < last:
+        # Out of order (e.g. merged from another machine)
+        if (last - day).days >= WINDOW_DAYS:
+            return False
+        new_day = key not in days
+        days[key] = round(days.get(key, 0.0) + max(0, int(duration_sec)) / 60, 1)
+        return _rescan_window_streaks(stats, day) if new_day else True
+
+    days[key] = round(days.get(key, 0.0) + max(0, int(duration_sec)) / 60, 1)
+    if last is None or day > last:
+        if last is not None and (day - last).days == 1:
+            stats["current_streak"] += 1
+        else:
+            stats["current_streak"] = 1
+        stats["last_date"] = key
+        stats["longest_streak"] = max(stats["longest_streak"], stats["current_streak"])
+
+    # Keep only the rolling window ending at the most recent focus day
+    newest = dt.date.fromisoformat(stats["last_date"])
+    cutoff = (newest - dt.timedelta(days=WINDOW_DAYS - 1)).isoformat()
+    for k in [k for k in days if k < cutoff]:
+        del days[k]
+    return True
+
+
+def _stats_path(data_dir: Path) -> Path:
+    return data_dir / STATS_FILE
+
+
+def file_edges(path: Path, size: int) -> tuple[str, str]:
+    """Digests of the first and of the last EDGE_BYTES bytes before `size`."""
+    with path.open("rb") as f:
+        head = f.read(min(size, EDGE_BYTES))
+        f.seek(max(0, size - EDGE_BYTES))
+        tail = f.read(size - max(0, size - EDGE_BYTES))
+    return (
+        hashlib.blake2b(head, digest_size=16).hexdigest(),
+        hashlib.blake2b(tail, digest_size=16).hexdigest(),
+    )
+
+
+def _fingerprint(csv_path: Path) -> dict:
+    """Size and edge digests of sessions.csv, stored with the state it was built from."""
+    size = csv_path.stat().st_size if csv_path.exists() else 0
+    head, tail = file_edges(csv_path, size) if size else ("", "")
+    return {"size": size, "head": head, "tail": tail}
+
+
+def _prefix_matches(csv_path: Path, source: dict | None) -> bool:
+    """True if sessions.csv still starts with the bytes the state was built from."""
+    if not source:
+        return False
+    size = csv_path.stat().st_size if csv_path.exists() else 0
+    if source["size"] > size:
+        return False
+    if not source["size"]:
+        return True
+    return file_edges(csv_path, source["size"]) == (source["head"], source["tail"])
+
+
+def _read_state(data_dir: Path) -> dict | None:
+    try:
+        stats = json.loads(_stats_path(data_dir).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return stats if set(_empty_stats()) <= set(stats) else None
+
+
+def save_stats(data_dir: Path, stats: dict) -> None:
+    _stats_path(data_dir).write_text(json.dumps(stats, indent=2), encoding="utf-8")
+
+
+def rebuild_stats(data_dir: Path) -> dict:
+    """
+    Recompute the analytics state from sessions.csv and save it.
+
+    This is the only code path that reads the whole history; it runs when the
+    state file is missing or no longer matches sessions.csv, and after bulk imports.
+    Rows with an unparsable start or duration are skipped.
+
+    If the rebuild fails (e.g. read-only data folder), an empty state carrying the
+    error is saved where possible and the failure is remembered for this process,
+    so recording further sessions does not rescan history again.
+
+    Args:
+        data_dir: Directory holding sessions.csv.
+
+    Returns:
+        The rebuilt stats dictionary.
+    """
+    csv_path = sessions_csv(data_dir)
+    stats = _empty_stats()
+    try:
+        rows = []
+        if csv_path.exists():
+            with csv_path.open(newline="", encoding="utf-8") as f:
+                for r in csv.DictReader(f):
+                    if r.get("phase") != "WORK":
+                        continue
+                    try:
+                        rows.append((dt.datetime.fromisoformat(r["start"] or ""),
+                                     int(float(r["duration_sec"] or 0))))
+                    except (TypeError, ValueError):
+                        continue
+        for start_dt, duration in sorted(rows):
+            _apply_session(stats, start_dt, duration)
+        stats["source"] = _fingerprint(csv_path)
+        save_stats(data_dir, stats)
+    except Exception as e:
+        _REBUILD_FAILED.add(data_dir)
+        failed = {**_empty_stats(), "error": str(e)}
+        try:
+            failed["source"] = _fingerprint(csv_path)
+            save_stats(data_dir, failed)
+        except Exception:
+            pass
+        raise
+    _REBUILD_FAILED.discard(data_dir)
+    return stats
+
+
+def load_stats(data_dir: Path) -> dict:
+    """
+    Load the analytics state, rebuilding it if it is missing, marked as failed,
+    or was built from a different sessions.csv (size or edge digests changed).
+
+    Args:
+        data_dir: Directory holding sessions.csv and analytics.json.
+
+    Returns:
+        The stats dictionary (see `_empty_stats` for the layout).
+    """
+    stats = _read_state(data_dir)
+    if stats and "error" not in stats and stats.get("source") == _fingerprint(sessions_csv(data_dir)):
+        return stats
+    return rebuild_stats(data_dir)
+
+
+def record_work_session(data_dir: Path, start_dt: dt.datetime, duration_sec: int) -> None:
+    """
+    Update the analytics state with a newly finished WORK session.
+
+    Args:
+        data_dir: Directory holding analytics.json.
+        start_dt: Start timestamp of the session (already in sessions.csv).
+        duration_sec: Session duration in seconds.
+    """
+    record_work_sessions(data_dir, [(start_dt, duration_sec)])
+
+
+def record_work_sessions(data_dir: Path, sessions) -> None:
+    """
+    Update the analytics state with WORK sessions just appended to sessions.csv.
+
+    Falls back to a rebuild if the state is missing or sessions.csv was replaced
+    or edited before the appended rows, and for sessions older than the rolling
+    window. After a failed rebuild nothing is rescanned until `load_stats` (e.g.
+    the Reports window) retries it.
+
+    Args:
+        data_dir: Directory holding analytics.json.
+        sessions: Iterable of (start_dt, duration_sec) pairs.
+    """
+    if data_dir in _REBUILD_FAILED:
+        return
+    csv_path = sessions_csv(data_dir)
+    stats = _read_state(data_dir)
+    if stats is not None and "error" in stats:
+        return
+    if stats is None or not _prefix_matches(csv_path, stats.get("source")):
+        rebuild_stats(data_dir)
+        return
+    for start_dt, duration_sec in sorted(sessions):
+        if not _apply_session(stats, start_dt, duration_sec):
+            rebuild_stats(data_dir)
+            return
+    stats["source"] = _fingerprint(csv_path)
+    save_stats(data_dir, stats)
+
+
+def current_streak(stats: dict, today: dt.date | None = None) -> int:
+    """Consecutive focus days up to today (a streak survives until today ends)."""
+    if not stats["last_date"]:
+        return 0
+    today = today or dt.date.today()
+    gap = (today - dt.date.fromisoformat(stats["last_date"])).days
+    return stats["current_streak"] if gap <= 1 else 0
+
+
+def longest_streak(stats: dict) -> int:
+    return int(stats["longest_streak"])
+
+
+def minutes_on(stats: dict, day: dt.date) -> float:
+    return float(stats["days"].get(day.isoformat(), 0.0))
+
+
+def goal_progress(stats: dict, goal_min: int, today: dt.date | None = None) -> dict:
+    """
+    Progress toward the daily focus goal.
+
+    Returns:
+        A dict with "minutes", "goal" and "ratio" (0.0–1.0, clamped).
+    """
+    today = today or dt.date.today()
+    done = minutes_on(stats, today)
+    goal = max(1, int(goal_min))
+    return {"minutes": done, "goal": goal, "ratio": min(1.0, done / goal)}
+
+
+def rolling_average(stats: dict, days: int, today: dt.date | None = None) -> float:
+    """Average WORK minutes per calendar day over the `days` days ending today."""
+    if not 1 <= days <= WINDOW_DAYS:
+        raise ValueError(f"days must be between 1 and {WINDOW_DAYS}")
+    today = today or dt.date.today()
+    total = sum(minutes_on(stats, today - dt.timedelta(days=i)) for i in range(days))
+    return round(total / days, 1)
+
+
+def summary(data_dir: Path, goal_min: int = DEFAULT_DAILY_GOAL_MIN, today: dt.date | None = None) -> dict:
+    """
+    Convenience API returning every metric at once.
+
+    Args:
+        data_dir: Directory holding analytics.json / sessions.csv.
+        goal_min: Daily focus goal in minutes.
+        today: Reference date (defaults to the current date).
+
+    Returns:
+        {"current_streak", "longest_streak", "goal", "avg_7d", "avg_28d"}
+    """
+    stats = load_stats(data_dir)
+    return {
+        "current_streak": current_streak(stats, today),
+        "longest_streak": longest_streak(stats),
+        "goal": goal_progress(stats, goal_min, today),
+        "avg_7d": rolling_average(stats, 7, today),
+        "avg_28d": rolling_average(stats, 28, today),
+    }
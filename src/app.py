@@ -6,25 +6,25 @@ Tkinter-based Pomodoro timer with:
 - Session logging to CSV (start, end, duration, tag)
 - System notifications and optional sound
 - Settings window (durations, sessions per long break, theme, sound/notify)
-- Reports window (daily/weekly minutes, top tags) with embedded matplotlib charts
+- Crash-resume: timer state checkpointed to data/timer.ckpt (rate-limited)
+- Reports window (daily/weekly minutes, top tags, streaks, daily goal, rolling averages)
+  with embedded matplotlib charts
 
 Entry point: main()
 Run with: python src/main.py
 """
 
 import tkinter as tk
+from tkinter import messagebox
 import datetime as dt
-from pathlib import Path
 
 from storage import load_config, append_session, save_config
 from settings import open_settings_window, apply_theme
 from timer import PomodoroTimer
 from notify import play_sound, show_notification  
 from reports import open_reports_window
-from paths import get_assets_dir, get_data_dir
-
-assets_dir = get_assets_dir()
-data_dir = get_data_dir()
+from paths import get_context
+from checkpoint import Checkpoint, CADENCE_MAX_GAP
 
 def fmt_time(seconds: int) -> str:
     """
@@ -70,9 +70,11 @@ def main():
         - Provide desktop notifications and optional sound per phase change.
         - Expose menu entries for Reports and Settings.
         - Bind keyboard shortcuts (Ctrl+S/P/R) to start/pause/reset.
+        - Checkpoint the timer state and offer to resume or log an interrupted phase.
 
     Side effects:
-        - Creates/uses a ./data directory to store sessions.csv and config.json.
+        - Creates/uses the data directory resolved by paths.get_context()
+          (./data in dev) to store sessions.csv and config.json.
         - May show system notifications and play a short sound if enabled.
     """
     root = tk.Tk()
@@ -86,9 +88,10 @@ def main():
     y = (root.winfo_screenheight() // 2) - (h // 2)     
     root.geometry(f"+{x}+{y}")
 
+    ctx = get_context()
+    assets_dir = ctx.assets_dir
+    data_dir = ctx.data_dir
     cfg = load_config()
-    apply_theme(root, cfg.get("theme", "light"))
-    assets_dir = Path.cwd() / "src" / "assets"
     # Set window icon (works on Windows; on Linux/macOS fallback to iconphoto)
     try:
         root.iconbitmap(str(assets_dir / "icon.ico"))
@@ -99,8 +102,6 @@ def main():
         except Exception:
             pass  # no icon available, skip
 
-    data_dir = Path.cwd() / "data"
-
     # Apply theme at startup
     apply_theme(root, cfg.get("theme", "light"))
 
@@ -110,7 +111,7 @@ def main():
     reports_menu = tk.Menu(menubar, tearoff=0)
     reports_menu.add_command(
         label="Open Reports",
-        command=lambda: open_reports_window(root, data_dir)
+        command=lambda: open_reports_window(root, data_dir, cfg)
     )
     menubar.add_cascade(label="Reports", menu=reports_menu)
 
@@ -147,7 +148,7 @@ def main():
     btn_reset = tk.Button(btn_frame, text="Reset")
 
     # Optional: Reports button (in addition to menu)
-    btn_reports = tk.Button(root, text="Reports", command=lambda: open_reports_window(root, data_dir))
+    btn_reports = tk.Button(root, text="Reports", command=lambda: open_reports_window(root, data_dir, cfg))
 
     # Layout
     lbl_mode.pack(pady=6)
@@ -172,6 +173,7 @@ def main():
             state: Current phase ("WORK", "SHORT", "LONG").
         """
         lbl_time.config(text=fmt_time(remaining))
+        checkpoint.maybe_save(timer, phase_start_dt["value"], tag_var.get())
 
     def persist_previous_phase(prev_phase: str, duration_sec: int):
         """
@@ -202,8 +204,10 @@ def main():
         play_sound(cfg, assets_dir)
         title, msg = phase_message(new_state)
         show_notification(cfg, title, msg)
+        checkpoint.save(timer, phase_start_dt["value"], tag_var.get())
 
     timer = PomodoroTimer(on_tick, on_phase_change, cfg)
+    checkpoint = Checkpoint(data_dir)
 
     # Persist the previous phase right before advancing
     original_advance = timer._advance_phase
@@ -214,24 +218,80 @@ def main():
         before delegating to the original advance method.
         """
         prev_phase = timer.state
-        if prev_phase == "WORK":
-            planned = cfg["work_sec"]
-        elif prev_phase == "SHORT":
-            planned = cfg["short_sec"]
-        else:
-            planned = cfg["long_sec"]
-
-        persist_previous_phase(prev_phase, planned)
+        persist_previous_phase(prev_phase, timer.planned_seconds(prev_phase))
         original_advance()
 
     timer._advance_phase = wrapped_advance
 
+    def resume_or_log_interrupted():
+        """
+        Offer to resume a phase interrupted by a crash or close, or to log it
+        to sessions.csv with its actual elapsed duration. When logging, the
+        long-break cadence (completed WORK sessions) is kept only if the
+        checkpoint is recent (see checkpoint.CADENCE_MAX_GAP).
+        """
+        saved = checkpoint.load()
+        if saved is None:
+            return
+        if saved["elapsed"] <= 0:
+            checkpoint.clear()
+            return
+        completed = saved["completed_work_sessions"]
+        resume = messagebox.askyesno(
+            "Resume session?",
+            f"An interrupted {saved['state']} phase was found "
+            f"({fmt_time(saved['elapsed'])} elapsed, {fmt_time(saved['remaining'])} left).\n\n"
+            "Yes: resume it\nNo: log it with its elapsed time and start fresh",
+            parent=root,
+        )
+        if resume:
+            timer.restore(saved["state"], saved["remaining"], completed)
+            phase_start_dt["value"] = saved["phase_start"]
+            tag_var.set(saved["tag"] or tag_var.get())
+            lbl_mode.config(text=saved["state"])
+            lbl_time.config(text=fmt_time(saved["remaining"]))
+            checkpoint.save(timer, phase_start_dt["value"], tag_var.get())
+        else:
+            start_dt = saved["phase_start"]
+            append_session(start_dt, start_dt + dt.timedelta(seconds=saved["elapsed"]),
+                           saved["state"], saved["elapsed"], saved["tag"])
+            if dt.datetime.now() - saved["saved_at"] > CADENCE_MAX_GAP:
+                completed = 0
+            timer.restore("WORK", cfg["work_sec"], completed)
+            checkpoint.clear()
+
+    def do_start():
+        """
+        Start the timer and checkpoint immediately. The phase start is kept
+        when continuing a paused or resumed phase.
+        """
+        if not timer.running and timer.remaining >= timer.planned_seconds():
+            phase_start_dt["value"] = dt.datetime.now()
+        timer.start(root)
+        checkpoint.save(timer, phase_start_dt["value"], tag_var.get())
+
+    def do_pause():
+        """
+        Pause the timer and checkpoint the exact remaining time.
+        """
+        timer.pause()
+        checkpoint.save(timer, phase_start_dt["value"], tag_var.get())
+
+    def on_close():
+        """
+        Checkpoint the phase in progress (or clear, if none) and quit.
+        """
+        if timer.remaining < timer.planned_seconds():
+            timer.pause()
+            checkpoint.save(timer, phase_start_dt["value"], tag_var.get())
+        else:
+            checkpoint.clear()
+        checkpoint.close()
+        root.destroy()
+
     # Buttons
-    btn_start.config(command=lambda: [
-        phase_start_dt.update(value=dt.datetime.now()),
-        timer.start(root),
-    ])
-    btn_pause.config(command=timer.pause)
+    btn_start.config(command=do_start)
+    btn_pause.config(command=do_pause)
 
     def do_reset():
         """
@@ -241,14 +301,17 @@ def main():
         lbl_time.config(text=fmt_time(cfg["work_sec"]))
         lbl_mode.config(text="WORK")
         phase_start_dt["value"] = dt.datetime.now()
+        checkpoint.clear()
 
     btn_reset.config(command=do_reset)
 
     # Keyboard shortcuts: Ctrl+S start, Ctrl+P pause, Ctrl+R reset
-    root.bind("<Control-s>", lambda e: [phase_start_dt.update(value=dt.datetime.now()), timer.start(root)])
-    root.bind("<Control-p>", lambda e: timer.pause())
+    root.bind("<Control-s>", lambda e: do_start())
+    root.bind("<Control-p>", lambda e: do_pause())
     root.bind("<Control-r>", lambda e: do_reset())
 
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    resume_or_log_interrupted()
 
     root.mainloop()
 
@@ -0,0 +1,120 @@
+"""
+Timer Checkpointing
+-------------------
+Crash-resume support: the timer state is mirrored into a small fixed-size file
+(`<data_dir>/timer.ckpt`) so an interrupted phase can be resumed or logged.
+
+Design notes
+- The file is memory-mapped once and updated in place with `struct.pack_into`;
+  a save is a ~100-byte memory write, no open/write/close or fsync.
+- Saves are rate-limited: `maybe_save` (called from the tick callback) writes at most
+  once every `min_interval` seconds. Phase changes, pause and close call `save`
+  directly. After a crash the elapsed time is therefore accurate to `min_interval`.
+- `clear` marks the checkpoint inactive (on Reset, or on a clean close with no phase
+  in progress) without deleting the file.
+
+Layout (little-endian, see `_FMT`):
+    magic, version, active, running, state, remaining, planned,
+    completed_work_sessions, phase_start (epoch), saved_at (epoch), tag (UTF-8, 64 bytes)
+"""
+
+from pathlib import Path
+import datetime as dt
+import mmap
+import struct
+import time
+
+CHECKPOINT_FILE = "timer.ckpt"
+# An interrupted phase that is logged instead of resumed keeps the long-break
+# cadence only if the app was closed for less than this
+CADENCE_MAX_GAP = dt.timedelta(hours=2)
+_MAGIC = b"PPCK"
+_VERSION = 1
+_FMT = "<4sBBBBiiIdd64s"
+SIZE = struct.calcsize(_FMT)
+_STATES = ["WORK", "SHORT", "LONG", "IDLE"]
+
+
+class Checkpoint:
+    def __init__(self, data_dir: Path, min_interval: float = 10.0, clock=time.monotonic):
+        self.path = data_dir / CHECKPOINT_FILE
+        self.min_interval = min_interval  # seconds between rate-limited saves
+        self.clock = clock
+        self._last_save = None
+        self._mm = None
+
+    def _map(self) -> mmap.mmap:
+        if self._mm is None:
+            if not self.path.exists() or self.path.stat().st_size != SIZE:
+                self.path.write_bytes(bytes(SIZE))
+            with self.path.open("r+b") as f:
+                self._mm = mmap.mmap(f.fileno(), SIZE)
+        return self._mm
+
+    def load(self) -> dict | None:
+        """
+        Read the last checkpoint, if an active one exists.
+
+        Returns:
+            A dict with "state", "remaining", "planned", "elapsed", "running",
+            "completed_work_sessions", "phase_start", "saved_at" and "tag";
+            None if there is no (valid, active) checkpoint.
+        """
+        try:
+            raw = self.path.read_bytes()
+        except OSError:
+            return None
+        if len(raw) != SIZE:
+            return None
+        (magic, version, active, running, state, remaining, planned,
+         completed, phase_start, saved_at, tag) = struct.unpack(_FMT, raw)
+        if magic != _MAGIC or version != _VERSION or not active:
+            return None
+        return {
+            "state": _STATES[state] if state < len(_STATES) else "WORK",
+            "remaining": max(0, remaining),
+            "planned": max(0, planned),
+            "elapsed": max(0, planned - remaining),
+            "running": bool(running),
+            "completed_work_sessions": completed,
+            "phase_start": dt.datetime.fromtimestamp(phase_start),
+            "saved_at": dt.datetime.fromtimestamp(saved_at),
+            "tag": tag.rstrip(b"\0").decode("utf-8", errors="ignore"),
+        }
+
+    def save(self, timer, phase_start: dt.datetime, tag: str = "") -> None:
+        """Write the current timer state unconditionally."""
+        state = _STATES.index(timer.state) if timer.state in _STATES else 0
+        struct.pack_into(
+            _FMT, self._map(), 0,
+            _MAGIC, _VERSION, 1, int(timer.running), state,
+            int(timer.remaining), int(timer.planned_seconds()), int(timer.completed_work_sessions),
+            phase_start.timestamp(), time.time(),
+            tag.strip().encode("utf-8")[:64],
+        )
+        self._last_save = self.clock()
+
+    def maybe_save(self, timer, phase_start: dt.datetime, tag: str = "") -> bool:
+        """
+        Save only if `min_interval` seconds passed since the last save.
+
+        Returns:
+            True if a write happened.
+        """
+        now = self.clock()
+        if self._last_save is not None and now - self._last_save < self.min_interval:
+            return False
+        self.save(timer, phase_start, tag)
+        return True
+
+    def clear(self) -> None:
+        """Mark the checkpoint inactive (nothing to resume)."""
+        if self._mm is not None or self.path.exists():
+            self._map()[5] = 0  # "active" byte right after magic + version
+        self._last_save = None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
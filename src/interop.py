@@ -0,0 +1,205 @@
+"""
+Arrow / Parquet Interop
+-----------------------
+Export and import of the session history in columnar formats, next to sessions.csv.
+
+Design notes
+- Exports stream sessions.csv in record batches (never the whole file in memory) and
+  write typed columns: `start`/`end` as timestamp[s], `phase` as a categorical
+  (dictionary over WORK/SHORT/LONG), `tag` dictionary-encoded, `duration_sec` int64.
+- Imports memory-map the source file, so loading is zero-copy where Arrow allows it,
+  and skip sessions already in sessions.csv (same (start, phase, tag) key as sync.py).
+- `pyarrow` is imported lazily: the rest of the app keeps working without it.
+
+Supported suffixes: .parquet/.pq (Parquet) and .arrow/.feather/.ipc (Arrow IPC file).
+"""
+
+from pathlib import Path
+import csv
+
+import sync
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+PHASES = ["WORK", "SHORT", "LONG"]
+BATCH_BYTES = 1 << 20
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet/Arrow support requires 'pyarrow' (pip install pyarrow)") from e
+    return pa, pc, pacsv, ipc, pq
+
+
+def format_of(path: Path) -> str:
+    """Return "parquet", "arrow" or "csv" based on the file suffix."""
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return "parquet"
+    if suffix in ARROW_SUFFIXES:
+        return "arrow"
+    return "csv"
+
+
+def sessions_schema():
+    pa = _pyarrow()[0]
+    return pa.schema([
+        ("start", pa.timestamp("s")),
+        ("end", pa.timestamp("s")),
+        ("phase", pa.dictionary(pa.int8(), pa.string())),
+        ("duration_sec", pa.int64()),
+        ("tag", pa.dictionary(pa.int32(), pa.string())),
+    ])
+
+
+def _iter_csv_batches(csv_path: Path):
+    """Yield typed record batches from sessions.csv, streaming in BATCH_BYTES blocks."""
+    pa, pc, pacsv, _, _ = _pyarrow()
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=BATCH_BYTES),
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                "start": pa.timestamp("s"),
+                "end": pa.timestamp("s"),
+                "phase": pa.string(),
+                "duration_sec": pa.int64(),
+                "tag": pa.string(),
+            },
+            strings_can_be_null=False,
+        ),
+    )
+    phases = pa.array(PHASES)
+    tags: list[str] = []
+    seen: set[str] = set()
+    for batch in reader:
+        # Tag dictionary only grows (new tags appended), so IPC can emit it as deltas
+        for t in pc.unique(batch.column("tag")).to_pylist():
+            if t not in seen:
+                seen.add(t)
+                tags.append(t)
+        tag_dict = pa.array(tags, pa.string())
+        phase_idx = pc.index_in(batch.column("phase"), value_set=phases).cast(pa.int8())
+        tag_idx = pc.index_in(batch.column("tag"), value_set=tag_dict).cast(pa.int32())
+        yield pa.RecordBatch.from_arrays(
+            [
+                batch.column("start"),
+                batch.column("end"),
+                pa.DictionaryArray.from_arrays(phase_idx, phases),
+                batch.column("duration_sec"),
+                pa.DictionaryArray.from_arrays(tag_idx, tag_dict),
+            ],
+            schema=sessions_schema(),
+        )
+
+
+def export_sessions(csv_path: Path, out_path: Path) -> int:
+    """
+    Write sessions.csv to Parquet or Arrow IPC, batch by batch.
+
+    Args:
+        csv_path: Source sessions.csv.
+        out_path: Destination file; the format is chosen from its suffix.
+
+    Returns:
+        Number of sessions written.
+    """
+    pa, _, _, ipc, pq = _pyarrow()
+    fmt = format_of(out_path)
+    if fmt == "csv":
+        raise ValueError(f"Unsupported export format: {out_path.suffix}")
+    if not csv_path.exists():
+        raise FileNotFoundError("sessions.csv not found")
+
+    rows = 0
+    if fmt == "parquet":
+        with pq.ParquetWriter(out_path, sessions_schema()) as writer:
+            for batch in _iter_csv_batches(csv_path):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        options = ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        with pa.OSFile(str(out_path), "wb") as sink, \
+                ipc.new_file(sink, sessions_schema(), options=options) as writer:
+            for batch in _iter_csv_batches(csv_path):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
+
+
+def read_table(path: Path):
+    """Read a Parquet or Arrow IPC session file through a memory map."""
+    pa, _, _, ipc, pq = _pyarrow()
+    fmt = format_of(path)
+    if fmt == "parquet":
+        return pq.read_table(path, memory_map=True)
+    if fmt == "arrow":
+        # Keep the map open: the table's buffers point into it (unmapped on GC)
+        return ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    raise ValueError(f"Unsupported import format: {path.suffix}")
+
+
+def _existing_keys(csv_path: Path) -> set:
+    """Dedup keys (start, phase, tag) already present in sessions.csv."""
+    if not csv_path.exists():
+        return set()
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        return {sync.row_key(row) for row in csv.reader(f) if len(row) >= 5}
+
+
+def import_sessions(src_path: Path, csv_path: Path) -> int:
+    """
+    Append the sessions of a Parquet/Arrow file to sessions.csv.
+
+    All rows are converted and validated before anything is written, and rows
+    whose (start, phase, tag) is already in sessions.csv are skipped (the same
+    dedup rule as sync.py), so re-importing an export is a no-op.
+
+    Args:
+        src_path: Parquet or Arrow IPC file (e.g. produced by `export_sessions`).
+        csv_path: Destination sessions.csv (created with a header if missing).
+
+    Returns:
+        Number of sessions appended.
+
+    Raises:
+        ValueError: If a row is missing a timestamp or duration, or has an unknown phase.
+    """
+    table = read_table(src_path)
+    seen = _existing_keys(csv_path)
+    out = []
+    n = 0
+    for batch in table.to_batches():
+        cols = batch.to_pydict()
+        for start, end, phase, duration, tag in zip(
+            cols["start"], cols["end"], cols["phase"], cols["duration_sec"], cols["tag"]
+        ):
+            n += 1
+            if start is None or end is None or duration is None or phase not in PHASES:
+                raise ValueError(f"Invalid session in {src_path.name} (row {n})")
+            row = [
+                start.isoformat(timespec="seconds"),
+                end.isoformat(timespec="seconds"),
+                phase,
+                int(duration),
+                (tag or "").strip(),
+            ]
+            key = sync.row_key([str(v) for v in row])
+            if key not in seen:
+                seen.add(key)
+                out.append(row)
+
+    if out:
+        new = not csv_path.exists()
+        with csv_path.open("a", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            if new:
+                w.writerow(["start", "end", "phase", "duration_sec", "tag"])
+            w.writerows(out)
+    return len(out)
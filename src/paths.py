@@ -1,26 +1,172 @@
+"""
+Runtime Paths & Config Cache
+----------------------------
+Single source of truth for where the app reads and writes files.
+
+Design notes
+- Nothing touches the filesystem at import time. `get_context()` returns one shared
+  `AppContext`; each location is resolved on first access and then cached.
+- Data directory, in order of preference:
+    1. $POMODORO_DATA_DIR
+    2. dev run (python src/app.py): <cwd>/data
+    3. PyInstaller build: <exe dir>/data if writable (portable, next to the executable),
+       otherwise the per-user dir: $XDG_DATA_HOME/pomodoro-pro (~/.local/share),
+       %APPDATA%\\PomodoroPro or ~/Library/Application Support/PomodoroPro.
+- config.json lives next to the data, except in the per-user case on Linux where it
+  goes to $XDG_CONFIG_HOME/pomodoro-pro (~/.config).
+- The parsed config is kept in memory and re-read only when the file's mtime changes.
+  Saves are atomic (temp file + os.replace), so a crash never leaves half a JSON file.
+"""
+
 from __future__ import annotations
+from functools import cached_property
 from pathlib import Path
+import json
+import os
 import sys
+import tempfile
+
+APP_NAME = "PomodoroPro"
+XDG_NAME = "pomodoro-pro"
+SESSIONS_FILE = "sessions.csv"
+
+
+def sessions_csv(data_dir: Path) -> Path:
+    """Location of the session log inside a data directory (this or another store)."""
+    return data_dir / SESSIONS_FILE
+
+
+def _is_frozen() -> bool:
+    return bool(getattr(sys, "frozen", False))
+
+
+def _user_dir(kind: str) -> Path:
+    """Per-user directory for `kind` ("data" or "config") following platform conventions."""
+    home = Path.home()
+    if sys.platform == "win32":
+        return Path(os.environ.get("APPDATA", home / "AppData" / "Roaming")) / APP_NAME
+    if sys.platform == "darwin":
+        return home / "Library" / "Application Support" / APP_NAME
+    if kind == "config":
+        return Path(os.environ.get("XDG_CONFIG_HOME") or home / ".config") / XDG_NAME
+    return Path(os.environ.get("XDG_DATA_HOME") or home / ".local" / "share") / XDG_NAME
+
+
+def _writable_dir(d: Path) -> bool:
+    try:
+        d.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(d, os.W_OK)
+
+
+class AppContext:
+    def __init__(self):
+        self._config: dict = {}
+        self._config_mtime = None  # st_mtime_ns of the last parsed config.json
+
+    @cached_property
+    def portable(self) -> bool:
+        """True if data lives in a project/exe-adjacent (or explicit) folder."""
+        if os.environ.get("POMODORO_DATA_DIR") or not _is_frozen():
+            return True
+        return _writable_dir(Path(sys.executable).resolve().parent / "data")
+
+    @cached_property
+    def data_dir(self) -> Path:
+        """Writable directory for sessions.csv and derived files (created on first use)."""
+        if os.environ.get("POMODORO_DATA_DIR"):
+            d = Path(os.environ["POMODORO_DATA_DIR"]).expanduser()
+        elif not _is_frozen():
+            d = Path.cwd() / "data"
+        elif self.portable:
+            d = Path(sys.executable).resolve().parent / "data"
+        else:
+            d = _user_dir("data")
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
+    @cached_property
+    def assets_dir(self) -> Path:
+        """
+        Directory where runtime assets live.
+        - In a PyInstaller onefile build: <_MEIPASS>/assets (copied there via 'datas')
+        - In dev: src/assets next to this module
+        """
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass and (Path(meipass) / "assets").exists():
+            return Path(meipass) / "assets"
+        return Path(__file__).resolve().parent / "assets"
+
+    @cached_property
+    def config_dir(self) -> Path:
+        if self.portable or sys.platform in ("win32", "darwin"):
+            return self.data_dir
+        d = _user_dir("config")
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
+    @property
+    def config_path(self) -> Path:
+        return self.config_dir / "config.json"
+
+    @property
+    def sessions_csv(self) -> Path:
+        return sessions_csv(self.data_dir)
+
+    def config(self) -> dict:
+        """
+        Return a copy of the parsed config.json ({} if missing or invalid).
+
+        The file is parsed again only if its mtime changed since the last read.
+        """
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except OSError:
+            self._config, self._config_mtime = {}, None
+            return {}
+        if mtime != self._config_mtime:
+            try:
+                parsed = json.loads(self.config_path.read_text(encoding="utf-8"))
+                self._config = parsed if isinstance(parsed, dict) else {}
+            except Exception:
+                self._config = {}
+            self._config_mtime = mtime
+        return dict(self._config)
+
+    def save_config(self, cfg: dict) -> None:
+        """Write config.json atomically and refresh the in-memory copy."""
+        path = self.config_path
+        fd, tmp = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cfg, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._config = dict(cfg)
+        self._config_mtime = path.stat().st_mtime_ns
+
+
+_context: AppContext | None = None
+
+
+def get_context() -> AppContext:
+    """Return the process-wide AppContext (created on first call)."""
+    global _context
+    if _context is None:
+        _context = AppContext()
+    return _context
+
 
 def get_assets_dir() -> Path:
-    """
-    Return the directory where runtime assets live.
-    - In a PyInstaller onefile build: <_MEIPASS>/assets
-    - In dev (python src/main.py):   <project>/src/assets
-    """
-    base = Path(getattr(sys, "_MEIPASS", Path.cwd()))
-    # When frozen, assets are copied to MEIPASS/assets via PyInstaller 'datas'
-    # In dev, we keep them under src/assets
-    meipass_assets = base / "assets"
-    if meipass_assets.exists():
-        return meipass_assets
-    return Path.cwd() / "src" / "assets"
+    """Return the directory where runtime assets live (see AppContext.assets_dir)."""
+    return get_context().assets_dir
+
 
 def get_data_dir() -> Path:
-    """
-    Return a writable data directory for sessions/config.
-    - Prefer <cwd>/data so users see files next to the executable/project.
-    """
-    d = Path.cwd() / "data"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    """Return a writable data directory for sessions/config (see AppContext.data_dir)."""
+    return get_context().data_dir
@@ -1,18 +1,27 @@
 # src/reports.py
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import pandas as pd
+import numpy as np
 import datetime as dt
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+import analytics
+import interop
+from paths import sessions_csv
+
 
 def load_sessions_df(csv_path: Path) -> pd.DataFrame:
+    """Load sessions from CSV, or from Parquet/Arrow IPC (chosen by file suffix)."""
     if not csv_path.exists():
-        raise FileNotFoundError("sessions.csv not found")
-    df = pd.read_csv(csv_path, parse_dates=["start", "end"])
+        raise FileNotFoundError(f"{csv_path.name} not found")
+    if interop.format_of(csv_path) == "csv":
+        df = pd.read_csv(csv_path, parse_dates=["start", "end"])
+    else:
+        df = interop.read_table(csv_path).to_pandas()
     # Normalize / guard
     if "phase" not in df.columns or "duration_sec" not in df.columns:
         raise ValueError("Invalid CSV schema")
@@ -39,7 +48,7 @@ def weekly_work_minutes(df: pd.DataFrame) -> pd.DataFrame:
     g = work.groupby(["year", "week"])["duration_sec"].sum().reset_index()
     g["minutes"] = (g["duration_sec"] / 60).round(1)
     g["year_week"] = g["year"].astype(str) + "-W" + g["week"].astype(str)
-    return g[["year_week", "minutes"]].sort_values(["year", "week"])
+    return g.sort_values(["year", "week"])[["year_week", "minutes"]]
 
 
 def top_tags(df: pd.DataFrame, n: int = 5) -> pd.DataFrame:
@@ -48,7 +57,7 @@ def top_tags(df: pd.DataFrame, n: int = 5) -> pd.DataFrame:
     w = df[df["phase"] == "WORK"]
     if w.empty:
         return pd.DataFrame(columns=["tag", "count"])
-    g = w["tag"].fillna("").str.strip()
+    g = w["tag"].astype(object).fillna("").astype(str).str.strip()
     g = g[g != ""]
     if g.empty:
         return pd.DataFrame(columns=["tag", "count"])
@@ -57,6 +66,67 @@ def top_tags(df: pd.DataFrame, n: int = 5) -> pd.DataFrame:
     return out
 
 
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+def _bin_weekday_hour(start_sec: np.ndarray, duration_sec: np.ndarray) -> np.ndarray:
+    """
+    Split sessions at hour boundaries and bin their minutes into a 7x24 grid.
+
+    Args:
+        start_sec: Session starts as seconds since the epoch (naive local time).
+        duration_sec: Session durations in seconds.
+
+    Returns:
+        A (7, 24) float array of minutes, rows Monday..Sunday, columns hour 0..23.
+    """
+    end_sec = start_sec + np.maximum(duration_sec, 0)
+    first_hour = start_sec // 3600
+    last_hour = np.maximum(end_sec - 1, start_sec) // 3600
+    spans = last_hour - first_hour + 1
+
+    # One slot per (session, hour touched): repeat each session over its hours
+    idx = np.repeat(np.arange(len(start_sec)), spans)
+    offset = np.arange(len(idx)) - np.repeat(np.cumsum(spans) - spans, spans)
+    hour = first_hour[idx] + offset
+    overlap = np.minimum(end_sec[idx], (hour + 1) * 3600) - np.maximum(start_sec[idx], hour * 3600)
+
+    # 1970-01-01 was a Thursday (weekday 3)
+    weekday = (hour // 24 + 3) % 7
+    cell = weekday * 24 + hour % 24
+    grid = np.bincount(cell, weights=np.maximum(overlap, 0) / 60, minlength=7 * 24)
+    return grid.reshape(7, 24)
+
+
+def weekday_hour_heatmap(df: pd.DataFrame) -> np.ndarray:
+    """
+    WORK minutes by weekday (rows) and hour of day (columns).
+
+    Sessions crossing an hour boundary have their minutes split across the
+    hours they cover. Binning is fully vectorized (one np.bincount), which is
+    fast enough to recompute on every refresh.
+    """
+    work = df[df["phase"] == "WORK"]
+    if work.empty:
+        return np.zeros((7, 24))
+    start_sec = work["start"].to_numpy().astype("datetime64[s]").astype(np.int64)
+    duration = work["duration_sec"].to_numpy().astype(np.int64)
+    return _bin_weekday_hour(start_sec, duration)
+
+
+def build_heatmap_figure(grid: np.ndarray):
+    """Return (figure, image artist); update later with `image.set_data`."""
+    fig = Figure(figsize=(7, 3.8), dpi=100)
+    ax = fig.add_subplot(111)
+    image = ax.imshow(grid, aspect="auto", cmap="Reds", origin="upper")
+    ax.set_title("Focus Minutes by Weekday and Hour")
+    ax.set_yticks(range(7), WEEKDAYS)
+    ax.set_xticks(range(0, 24, 2))
+    ax.set_xlabel("Hour of start")
+    fig.colorbar(image, ax=ax, label="Minutes")
+    fig.tight_layout()
+    return fig, image
+
+
 def build_bar_figure(x_labels, y_values, title: str) -> Figure:
     fig = Figure(figsize=(7, 3.8), dpi=100)
     ax = fig.add_subplot(111)
@@ -69,8 +139,9 @@ def build_bar_figure(x_labels, y_values, title: str) -> Figure:
     return fig
 
 
-def open_reports_window(parent: tk.Tk, data_dir: Path):
-    csv_path = data_dir / "sessions.csv"
+def open_reports_window(parent: tk.Tk, data_dir: Path, cfg: dict | None = None):
+    csv_path = sessions_csv(data_dir)
+    goal_min = (cfg or {}).get("daily_goal_min", analytics.DEFAULT_DAILY_GOAL_MIN)
 
     win = tk.Toplevel(parent)
     win.title("Reports — Pomodoro")
@@ -91,8 +162,12 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
     # Buttons
     btn_refresh = ttk.Button(top, text="Refresh")
     btn_open_folder = ttk.Button(top, text="Open data folder")
+    btn_export = ttk.Button(top, text="Export…")
+    btn_import = ttk.Button(top, text="Import…")
     btn_refresh.pack(side="left", padx=(0, 6))
     btn_open_folder.pack(side="left", padx=6)
+    btn_export.pack(side="left", padx=6)
+    btn_import.pack(side="left", padx=6)
 
     # Tabs
     nb = ttk.Notebook(body)
@@ -102,11 +177,21 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
     nb.add(tab_daily, text="Daily")
     nb.add(tab_weekly, text="Weekly")
     nb.add(tab_tags, text="Top Tags")
+    tab_streaks = ttk.Frame(nb)
+    tab_goal = ttk.Frame(nb)
+    tab_avg = ttk.Frame(nb)
+    nb.add(tab_streaks, text="Streaks")
+    nb.add(tab_goal, text="Goal")
+    nb.add(tab_avg, text="Averages")
+    tab_heatmap = ttk.Frame(nb)
+    nb.add(tab_heatmap, text="Heatmap")
     nb.pack(fill="both", expand=True)
 
     # Canvas placeholders
     daily_canvas = None
     weekly_canvas = None
+    heatmap_canvas = None
+    heatmap_image = None
 
     # Tables
     daily_table = ttk.Treeview(tab_daily, columns=("date", "minutes"), show="headings", height=8)
@@ -124,14 +209,55 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
     tags_table.heading("count", text="Count")
     tags_table.pack(fill="both", expand=True, padx=6, pady=6)
 
+    # Incremental analytics (read from analytics.json, no history scan)
+    big = ("Segoe UI", 20)
+    lbl_cur_streak = ttk.Label(tab_streaks, text="", font=big)
+    lbl_cur_streak.pack(pady=(24, 6))
+    lbl_long_streak = ttk.Label(tab_streaks, text="")
+    lbl_long_streak.pack(pady=6)
+
+    lbl_goal = ttk.Label(tab_goal, text="", font=big)
+    lbl_goal.pack(pady=(24, 6))
+    goal_bar = ttk.Progressbar(tab_goal, orient="horizontal", length=420, maximum=100)
+    goal_bar.pack(pady=6)
+
+    lbl_avg7 = ttk.Label(tab_avg, text="", font=big)
+    lbl_avg7.pack(pady=(24, 6))
+    lbl_avg28 = ttk.Label(tab_avg, text="", font=big)
+    lbl_avg28.pack(pady=6)
+
+    def refresh_analytics() -> str:
+        """Update the Streaks/Goal/Averages tabs; return an error message or ""."""
+        try:
+            stats = analytics.summary(data_dir, goal_min)
+        except Exception as e:
+            msg = f"Analytics unavailable: {e}"
+            for lbl in (lbl_cur_streak, lbl_goal, lbl_avg7):
+                lbl.config(text=msg)
+            for lbl in (lbl_long_streak, lbl_avg28):
+                lbl.config(text="")
+            goal_bar["value"] = 0
+            return msg
+        lbl_cur_streak.config(text=f"Current streak: {stats['current_streak']} day(s)")
+        lbl_long_streak.config(text=f"Longest streak: {stats['longest_streak']} day(s)")
+        goal = stats["goal"]
+        lbl_goal.config(text=f"Today: {goal['minutes']:.0f} / {goal['goal']} min")
+        goal_bar["value"] = goal["ratio"] * 100
+        lbl_avg7.config(text=f"7-day average: {stats['avg_7d']:.1f} min/day")
+        lbl_avg28.config(text=f"28-day average: {stats['avg_28d']:.1f} min/day")
+        return ""
+
     chart_frame_daily = ttk.Frame(tab_daily)
     chart_frame_daily.pack(fill="both", expand=True, padx=6, pady=6)
 
     chart_frame_weekly = ttk.Frame(tab_weekly)
     chart_frame_weekly.pack(fill="both", expand=True, padx=6, pady=6)
 
+    chart_frame_heatmap = ttk.Frame(tab_heatmap)
+    chart_frame_heatmap.pack(fill="both", expand=True, padx=6, pady=6)
+
     def refresh():
-        nonlocal daily_canvas, weekly_canvas
+        nonlocal daily_canvas, weekly_canvas, heatmap_canvas, heatmap_image
         try:
             df = load_sessions_df(csv_path)
         except FileNotFoundError:
@@ -179,6 +305,17 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
         else:
             ttk.Label(chart_frame_weekly, text="No WORK data to display yet.").pack(pady=10)
 
+        # Heatmap (figure built once; later refreshes only swap the image data)
+        grid = weekday_hour_heatmap(df)
+        if heatmap_canvas is None:
+            fig_h, heatmap_image = build_heatmap_figure(grid)
+            heatmap_canvas = FigureCanvasTkAgg(fig_h, master=chart_frame_heatmap)
+            heatmap_canvas.get_tk_widget().pack(fill="both", expand=True)
+        else:
+            heatmap_image.set_data(grid)
+        heatmap_image.set_clim(0, max(1.0, float(grid.max())))
+        heatmap_canvas.draw_idle()
+
         # Tags
         tdf = top_tags(df, n=8)
         for row in tags_table.get_children():
@@ -186,7 +323,9 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
         if not tdf.empty:
             for _, r in tdf.iterrows():
                 tags_table.insert("", "end", values=(r["tag"], int(r["count"])))
-        status.config(text=f"Loaded {len(df)} sessions.")
+        # Analytics have their own error handling so the charts above still render
+        analytics_error = refresh_analytics()
+        status.config(text=f"Loaded {len(df)} sessions." + (f" {analytics_error}" if analytics_error else ""))
 
     def open_folder():
         try:
@@ -202,7 +341,37 @@ def open_reports_window(parent: tk.Tk, data_dir: Path):
             except Exception:
                 messagebox.showinfo("Folder", f"Data folder: {data_dir}")
 
+    filetypes = [("Parquet", "*.parquet"), ("Arrow IPC", "*.arrow")]
+
+    def export_data():
+        path = filedialog.asksaveasfilename(
+            parent=win, title="Export sessions", defaultextension=".parquet", filetypes=filetypes
+        )
+        if not path:
+            return
+        try:
+            n = interop.export_sessions(csv_path, Path(path))
+        except Exception as e:
+            messagebox.showerror("Export failed", str(e))
+            return
+        status.config(text=f"Exported {n} sessions to {path}")
+
+    def import_data():
+        path = filedialog.askopenfilename(parent=win, title="Import sessions", filetypes=filetypes)
+        if not path:
+            return
+        try:
+            n = interop.import_sessions(Path(path), csv_path)
+        except Exception as e:
+            messagebox.showerror("Import failed", str(e))
+            return
+        # refresh() rebuilds the analytics state (sessions.csv changed) and reports errors
+        refresh()
+        status.config(text=f"Imported {n} sessions from {path}. {status.cget('text')}")
+
     btn_refresh.config(command=refresh)
     btn_open_folder.config(command=open_folder)
+    btn_export.config(command=export_data)
+    btn_import.config(command=import_data)
 
     refresh()
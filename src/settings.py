@@ -2,6 +2,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+import analytics
+
 def apply_theme(root: tk.Tk, theme: str):
     """Very simple theme switcher for tk widgets."""
     if theme == "dark":
@@ -41,7 +43,7 @@ def open_settings_window(parent, cfg: dict, save_fn, apply_theme_fn):
     """
     win = tk.Toplevel(parent)
     win.title("Settings")
-    win.geometry("360x360")
+    win.geometry("360x400")
     win.transient(parent)
     win.grab_set()
 
@@ -60,6 +62,7 @@ def open_settings_window(parent, cfg: dict, save_fn, apply_theme_fn):
     sound_var = tk.BooleanVar(value=bool(cfg.get("sound", True)))
     notify_var = tk.BooleanVar(value=bool(cfg.get("notify", True)))
     theme_var = tk.StringVar(value=cfg.get("theme", "light"))
+    goal_var = tk.IntVar(value=int(cfg.get("daily_goal_min", analytics.DEFAULT_DAILY_GOAL_MIN)))
 
     pad = {"padx": 10, "pady": 6}
 
@@ -85,8 +88,11 @@ def open_settings_window(parent, cfg: dict, save_fn, apply_theme_fn):
     theme_combo = ttk.Combobox(frm, textvariable=theme_var, values=["light", "dark"], width=8, state="readonly")
     theme_combo.grid(row=6, column=1, sticky="w")
 
+    ttk.Label(frm, text="Daily goal (minutes)").grid(row=7, column=0, sticky="w")
+    ttk.Entry(frm, textvariable=goal_var, width=10).grid(row=7, column=1, sticky="w")
+
     btns = ttk.Frame(frm)
-    btns.grid(row=7, column=0, columnspan=2, sticky="e", pady=(12, 0))
+    btns.grid(row=8, column=0, columnspan=2, sticky="e", pady=(12, 0))
 
     def on_save():
         try:
@@ -94,6 +100,7 @@ def open_settings_window(parent, cfg: dict, save_fn, apply_theme_fn):
             s = max(1, int(short_var.get()))
             l = max(1, int(long_var.get()))
             sp = max(1, int(sessions_var.get()))
+            goal = max(1, int(goal_var.get()))
         except Exception:
             messagebox.showerror("Invalid input", "Please enter valid integer values.")
             return
@@ -106,6 +113,7 @@ def open_settings_window(parent, cfg: dict, save_fn, apply_theme_fn):
             "sound": bool(sound_var.get()),
             "notify": bool(notify_var.get()),
             "theme": theme_var.get(),
+            "daily_goal_min": goal,
         })
         save_fn(cfg)
         apply_theme_fn(parent, cfg["theme"])
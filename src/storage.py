@@ -1,14 +1,11 @@
-from pathlib import Path
 import csv
 import datetime as dt
-import json
+import logging
 
-DATA_DIR = Path.cwd() / "data"
-ASSETS_DIR = Path.cwd() / "src" / "assets"
-DATA_DIR.mkdir(exist_ok=True, parents=True)
+import analytics
+from paths import get_context
 
-SESSIONS_CSV = DATA_DIR / "sessions.csv"
-CONFIG_JSON = DATA_DIR / "config.json"
+log = logging.getLogger(__name__)
 
 DEFAULT_CFG = {
     "work_sec": 25 * 60,
@@ -18,22 +15,20 @@ DEFAULT_CFG = {
     "sound": True,
     "notify": True,
     "theme": "light",
+    "daily_goal_min": analytics.DEFAULT_DAILY_GOAL_MIN,
 }
 
 def load_config() -> dict:
-    if CONFIG_JSON.exists():
-        try:
-            return json.loads(CONFIG_JSON.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return DEFAULT_CFG.copy()
+    # cached in memory by the context; config.json is re-read only when it changes
+    return {**DEFAULT_CFG, **get_context().config()}
 
 def save_config(cfg: dict) -> None:
-    CONFIG_JSON.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+    get_context().save_config(cfg)
 
 def append_session(start_dt: dt.datetime, end_dt: dt.datetime, phase: str, duration_sec: int, tag: str = "") -> None:
-    new = not SESSIONS_CSV.exists()
-    with SESSIONS_CSV.open("a", newline="", encoding="utf-8") as f:
+    ctx = get_context()
+    new = not ctx.sessions_csv.exists()
+    with ctx.sessions_csv.open("a", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         if new:
             w.writerow(["start", "end", "phase", "duration_sec", "tag"])
@@ -44,3 +39,9 @@ def append_session(start_dt: dt.datetime, end_dt: dt.datetime, phase: str, durat
             int(duration_sec),
             tag.strip(),
         ])
+    if phase == "WORK":
+        # Analytics are derived data: never let them break the timer loop
+        try:
+            analytics.record_work_session(ctx.data_dir, start_dt, duration_sec)
+        except Exception:
+            log.exception("Failed to update analytics for session starting %s", start_dt)
@@ -0,0 +1,249 @@
+"""
+Session Store Sync
+------------------
+Two-way merge of the session logs of two data directories (e.g. desktop and
+laptop, or a local folder and a mounted share).
+
+Design notes
+- Each store keeps `<data_dir>/sync_index.json`: per partition (calendar month of
+  the session start) a content hash, a row count and the byte ranges of its rows
+  in sessions.csv. sessions.csv is append-only, so the index is brought up to date
+  by reading only the bytes appended since the last run.
+- Row hash = 64-bit BLAKE2b of the dedup key (start, phase, tag); partition hash =
+  sum of row hashes mod 2**64, which is independent of row order. Each key counts
+  once, so a store holding duplicate rows still matches a store without them.
+- Partitions with equal hash and count are skipped without reading any rows; only
+  the byte ranges of differing partitions are read and diffed.
+- Rows missing on one side are appended to it verbatim, so neither store ever
+  rewrites existing rows. Work done is proportional to what changed.
+
+Usage:
+    python src/sync.py <data_dir_a> <data_dir_b>
+"""
+
+from pathlib import Path
+import argparse
+import csv
+import datetime as dt
+import hashlib
+import json
+import logging
+
+import analytics
+from paths import sessions_csv
+
+log = logging.getLogger(__name__)
+
+INDEX_FILE = "sync_index.json"
+INDEX_VERSION = 2
+HEADER = b"start,end,phase,duration_sec,tag"
+_MASK = (1 << 64) - 1
+
+
+def row_key(row: list[str]) -> tuple[str, str, str]:
+    """Dedup key of a parsed sessions.csv row: (start, phase, tag)."""
+    return row[0], row[2], row[4].strip()
+
+
+def row_hash(key: tuple[str, str, str]) -> int:
+    digest = hashlib.blake2b("\x1f".join(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _parse_line(line: bytes) -> list[str] | None:
+    """Parse one sessions.csv line; None for the header, blank or malformed lines."""
+    try:
+        text = line.decode("utf-8").rstrip("\r\n")
+    except UnicodeDecodeError:
+        return None
+    if not text or text.encode("utf-8") == HEADER:
+        return None
+    row = next(csv.reader([text]))
+    return row if len(row) >= 5 else None
+
+
+def _empty_index() -> dict:
+    return {"version": INDEX_VERSION, "size": 0, "head": "", "tail": "", "partitions": {}}
+
+
+def update_index(data_dir: Path) -> dict:
+    """
+    Bring `sync_index.json` up to date with sessions.csv, reading only new bytes.
+
+    The index is rebuilt from scratch if sessions.csv shrank, or if its first bytes
+    or the bytes just before the indexed size changed (i.e. it was replaced, for
+    example by copying another store's file over it, rather than appended to).
+
+    Args:
+        data_dir: Data directory holding sessions.csv.
+
+    Returns:
+        The index dictionary.
+    """
+    csv_path = sessions_csv(data_dir)
+    index_path = data_dir / INDEX_FILE
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except Exception:
+        index = _empty_index()
+
+    size = csv_path.stat().st_size if csv_path.exists() else 0
+    if index.get("size", 0) > size or (
+        index.get("size")
+        and analytics.file_edges(csv_path, index["size"]) != (index.get("head"), index.get("tail"))
+    ):
+        # sessions.csv was replaced or edited: the analytics state is stale as well
+        index = _empty_index()
+        try:
+            analytics.rebuild_stats(data_dir)
+        except Exception:
+            log.exception("Failed to rebuild analytics for %s", data_dir)
+    elif index.get("version") != INDEX_VERSION:
+        index = _empty_index()
+    if index["size"] == size:
+        return index
+
+    partitions = index["partitions"]
+    # Keys already counted per partition; for partitions indexed on an earlier run
+    # they are read lazily from that partition's byte ranges only
+    old_ranges = {name: [r[:] for r in part["ranges"]] for name, part in partitions.items()}
+    seen: dict[str, set] = {}
+    with csv_path.open("rb") as f:
+        f.seek(index["size"])
+        chunk = f.read(size - index["size"])
+    offset = index["size"]
+    end = chunk.rfind(b"\n") + 1  # ignore a trailing partial line
+    for line in chunk[:end].splitlines(keepends=True):
+        row = _parse_line(line)
+        if row:
+            key = row_key(row)
+            name = key[0][:7]
+            part = partitions.setdefault(name, {"hash": 0, "count": 0, "ranges": []})
+            if name not in seen:
+                seen[name] = set(_read_partition(csv_path, old_ranges.get(name, [])))
+            if key not in seen[name]:
+                seen[name].add(key)
+                part["hash"] = (part["hash"] + row_hash(key)) & _MASK
+                part["count"] += 1
+            ranges = part["ranges"]
+            if ranges and ranges[-1][1] == offset:
+                ranges[-1][1] = offset + len(line)
+            else:
+                ranges.append([offset, offset + len(line)])
+        offset += len(line)
+
+    index["size"] = offset
+    index["head"], index["tail"] = analytics.file_edges(csv_path, offset) if offset else ("", "")
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    return index
+
+
+def _read_partition(csv_path: Path, ranges: list) -> dict:
+    """Return {key: raw line} for the rows in the given byte ranges."""
+    rows = {}
+    if not ranges or not csv_path.exists():
+        return rows
+    with csv_path.open("rb") as f:
+        for lo, hi in ranges:
+            f.seek(lo)
+            for line in f.read(hi - lo).splitlines(keepends=True):
+                row = _parse_line(line)
+                if row:
+                    rows.setdefault(row_key(row), line)
+    return rows
+
+
+def _append_lines(data_dir: Path, lines: list[bytes]) -> None:
+    data_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = sessions_csv(data_dir)
+    with csv_path.open("ab") as f:
+        if f.tell() == 0:
+            f.write(HEADER + b"\r\n")
+        for line in lines:
+            f.write(line if line.endswith(b"\n") else line + b"\r\n")
+
+
+def _ends_with_newline(csv_path: Path) -> bool:
+    if not csv_path.exists() or csv_path.stat().st_size == 0:
+        return True
+    with csv_path.open("rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def _record_analytics(data_dir: Path, lines: list[bytes]) -> None:
+    work = []
+    for line in lines:
+        row = _parse_line(line)
+        if row and row[2] == "WORK":
+            try:
+                work.append((dt.datetime.fromisoformat(row[0]), int(float(row[3] or 0))))
+            except ValueError:
+                continue
+    if work:
+        analytics.record_work_sessions(data_dir, work)
+
+
+def sync_stores(dir_a: Path, dir_b: Path) -> dict:
+    """
+    Merge the session logs of two data directories in both directions.
+
+    Args:
+        dir_a: First data directory.
+        dir_b: Second data directory.
+
+    Either directory may be missing or have no sessions.csv yet; it is created
+    when rows are appended to it.
+
+    Returns:
+        {"partitions": total, "skipped": identical partitions,
+         "added_to_a": rows, "added_to_b": rows}
+    """
+    for d in (dir_a, dir_b):
+        csv_path = sessions_csv(d)
+        if not _ends_with_newline(csv_path):
+            with csv_path.open("ab") as f:
+                f.write(b"\r\n")
+    index_a, index_b = update_index(dir_a), update_index(dir_b)
+    parts_a, parts_b = index_a["partitions"], index_b["partitions"]
+
+    empty = {"hash": 0, "count": 0, "ranges": []}
+    to_a: list[bytes] = []
+    to_b: list[bytes] = []
+    skipped = 0
+    for name in sorted(set(parts_a) | set(parts_b)):
+        pa, pb = parts_a.get(name, empty), parts_b.get(name, empty)
+        if pa["hash"] == pb["hash"] and pa["count"] == pb["count"]:
+            skipped += 1
+            continue
+        rows_a = _read_partition(sessions_csv(dir_a), pa["ranges"])
+        rows_b = _read_partition(sessions_csv(dir_b), pb["ranges"])
+        to_b.extend(line for key, line in rows_a.items() if key not in rows_b)
+        to_a.extend(line for key, line in rows_b.items() if key not in rows_a)
+
+    for d, lines in ((dir_a, to_a), (dir_b, to_b)):
+        if lines:
+            _append_lines(d, lines)
+            update_index(d)
+            _record_analytics(d, lines)
+
+    return {
+        "partitions": len(set(parts_a) | set(parts_b)),
+        "skipped": skipped,
+        "added_to_a": len(to_a),
+        "added_to_b": len(to_b),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge the session logs of two Pomodoro data folders.")
+    parser.add_argument("dir_a", type=Path, help="first data folder (e.g. ./data)")
+    parser.add_argument("dir_b", type=Path, help="second data folder (e.g. a mounted share)")
+    args = parser.parse_args()
+    r = sync_stores(args.dir_a, args.dir_b)
+    print(f"{r['partitions']} partitions, {r['skipped']} identical; "
+          f"added {r['added_to_a']} to {args.dir_a}, {r['added_to_b']} to {args.dir_b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,21 @@ class PomodoroTimer:
         self.state = "WORK"
         self.remaining = self.cfg["work_sec"]
 
+    def planned_seconds(self, state=None):
+        state = state or self.state
+        if state == "WORK":
+            return self.cfg["work_sec"]
+        if state == "SHORT":
+            return self.cfg["short_sec"]
+        return self.cfg["long_sec"]
+
+    def restore(self, state, remaining, completed_work_sessions):
+        # retoma uma fase interrompida (ver checkpoint.py); não inicia o timer
+        self.running = False
+        self.state = state
+        self.remaining = remaining
+        self.completed_work_sessions = completed_work_sessions
+
     def _tick(self, tk_root):
         if not self.running:
             return
@@ -0,0 +1,57 @@
+"""Smoke tests for sync.py (run with: python -m pytest -q)."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import sync  # noqa: E402
+from paths import sessions_csv  # noqa: E402
+
+HEADER = "start,end,phase,duration_sec,tag\n"
+ROWS = [
+    "2025-09-11T09:19:06,2025-09-11T09:44:06,WORK,1500,Python\n",
+    "2025-09-11T09:44:06,2025-09-11T09:49:06,SHORT,300,Python\n",
+    "2025-10-02T10:00:00,2025-10-02T10:25:00,WORK,1500,Reading\n",
+]
+
+
+def write_store(d: Path, rows) -> None:
+    d.mkdir(parents=True, exist_ok=True)
+    sessions_csv(d).write_text(HEADER + "".join(rows), encoding="utf-8")
+
+
+def session_lines(d: Path) -> list[str]:
+    return sorted(sessions_csv(d).read_text(encoding="utf-8").splitlines()[1:])
+
+
+def test_sync_into_empty_folder(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    write_store(a, ROWS)
+    b.mkdir()
+
+    r = sync.sync_stores(a, b)
+
+    assert r["added_to_b"] == len(ROWS) and r["added_to_a"] == 0
+    assert session_lines(a) == session_lines(b)
+
+
+def test_sync_from_missing_folder(tmp_path):
+    a, b = tmp_path / "missing", tmp_path / "b"
+    write_store(b, ROWS)
+
+    r = sync.sync_stores(a, b)
+
+    assert r["added_to_a"] == len(ROWS)
+    assert session_lines(a) == session_lines(b)
+
+
+def test_duplicates_do_not_keep_partition_dirty(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    write_store(a, ROWS + ROWS[:1])  # duplicate row in a
+    write_store(b, ROWS)
+
+    r = sync.sync_stores(a, b)
+
+    assert r["skipped"] == r["partitions"]
+    assert r["added_to_a"] == r["added_to_b"] == 0